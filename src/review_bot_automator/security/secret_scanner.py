@@ -3,13 +3,15 @@
 """Secret detection and prevention system."""
 
 import logging
+import os
 import re
-from collections.abc import Generator
+from collections.abc import Generator, Iterable
+from contextlib import closing
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
-from re import Pattern
-from typing import TYPE_CHECKING, ClassVar, TypeAlias
+from re import Match, Pattern
+from typing import TYPE_CHECKING, ClassVar, TextIO, TypeAlias
 
 if TYPE_CHECKING:
     from review_bot_automator.security.config import SecurityConfig
@@ -34,6 +36,53 @@ SummaryDict: TypeAlias = dict[str, int]
 # Tuple containing: (regex pattern, secret type name, severity level)
 PatternDef: TypeAlias = tuple[Pattern[str], str, Severity]
 
+# Type alias for an accepted pattern match before it becomes a SecretFinding
+# Tuple containing: (line number, line, match, secret type name, severity level)
+RawMatch: TypeAlias = tuple[int, str, Match[str], str, Severity]
+
+# Type alias for what the file scanning methods accept: a path or an open text stream
+FileSource: TypeAlias = str | os.PathLike[str] | TextIO
+
+
+# Leading inline flag group, e.g. "(?i)" at the start of a pattern
+_LEADING_FLAGS_RE = re.compile(r"\(\?[aiLmsux]+\)")
+
+# Pattern flags that can be expressed as a scoped inline group "(?flags:...)"
+_SCOPED_FLAG_LETTERS: tuple[tuple[re.RegexFlag, str], ...] = (
+    (re.ASCII, "a"),
+    (re.IGNORECASE, "i"),
+    (re.MULTILINE, "m"),
+    (re.DOTALL, "s"),
+    (re.VERBOSE, "x"),
+)
+
+
+def _combine_patterns(patterns: list[PatternDef]) -> Pattern[str]:
+    """Join secret patterns into one alternation compiled once.
+
+    Each pattern's flags are rewritten as a scoped group so they only apply to
+    that alternative. The result matches a string if and only if at least one
+    of the individual patterns does, so it can reject secret-free lines in a
+    single regex pass.
+
+    Args:
+        patterns: Secret pattern definitions to combine.
+
+    Returns:
+        Pattern[str]: Compiled alternation of all patterns.
+    """
+    alternatives: list[str] = []
+    for pattern, _secret_type, _severity in patterns:
+        source = pattern.pattern
+        leading_flags = _LEADING_FLAGS_RE.match(source)
+        if leading_flags:
+            source = source[leading_flags.end() :]
+        flag_letters = "".join(
+            letter for flag, letter in _SCOPED_FLAG_LETTERS if pattern.flags & flag
+        )
+        alternatives.append(f"(?{flag_letters}:{source})")
+    return re.compile("|".join(alternatives))
+
 
 @dataclass(frozen=True, slots=True)
 class SecretFinding:
@@ -141,6 +190,33 @@ class SecretScanner:
         ),
     ]
 
+    # All PATTERNS as one alternation, used to skip lines that cannot contain a secret
+    COMBINED_PATTERN: ClassVar[Pattern[str]] = _combine_patterns(PATTERNS)
+
+    # Literals that must appear in a line for the pattern of that type to match.
+    # Case-insensitive patterns list lowercase literals that are checked against the
+    # casefolded line; they avoid "i" because re also matches it against "\u0130"/"\u0131".
+    # Patterns without an entry are always evaluated.
+    PATTERN_LITERALS: ClassVar[dict[str, tuple[str, ...]]] = {
+        "github_personal_token": ("ghp_",),
+        "github_oauth_token": ("gho_",),
+        "github_server_token": ("ghs_",),
+        "github_refresh_token": ("ghr_",),
+        "aws_access_key": ("AKIA",),
+        "aws_secret_key": ("aws",),
+        "openai_api_key": ("sk-",),
+        "jwt_token": ("eyJ",),
+        "private_key": ("-----BEGIN",),
+        "slack_token": ("xox",),
+        "google_oauth": ("ya29.",),
+        "azure_connection_string": ("accountkey=",),
+        "database_url_with_password": ("://",),
+        "generic_api_key": ("key",),
+        "password": ("passw", "pwd"),
+        "generic_secret": ("secret",),
+        "generic_token": ("token",),
+    }
+
     # False positive patterns - common test/example values (precompiled for performance)
     FALSE_POSITIVE_PATTERNS: ClassVar[list[Pattern[str]]] = [
         re.compile(r"(?i)(example|test|dummy|fake|sample|placeholder|your[-_])"),
@@ -152,6 +228,11 @@ class SecretScanner:
         re.compile(r"(?i)(redacted|hidden|masked)"),
     ]
 
+    # Markers used by _is_false_positive, built once rather than per check
+    COMMENT_MARKERS: ClassVar[tuple[str, ...]] = ("#", "//", "/*", "<!--")
+    DOC_MARKERS: ClassVar[tuple[str, ...]] = (*COMMENT_MARKERS, "example:", "e.g.", "```")
+    TEST_KEYWORDS: ClassVar[tuple[str, ...]] = ("example", "test", "dummy", "sample")
+
     @staticmethod
     def scan_content(
         content: str, stop_on_first: bool = False, config: "SecurityConfig | None" = None
@@ -180,7 +261,7 @@ class SecretScanner:
             logger.debug("Secret scanning disabled by configuration")
             return []
 
-        logger.debug("Starting content scan, %d lines to process", len(content.split("\n")))
+        logger.debug("Starting content scan, %d lines to process", content.count("\n") + 1)
         findings: list[SecretFinding] = []
 
         # Delegate to generator and collect findings
@@ -215,21 +296,64 @@ class SecretScanner:
             ...     print(f"Found {finding.secret_type}")
             ...     break  # Early exit on first finding
         """
-        logger.debug(
-            "Starting generator content scan, %d lines to process", len(content.split("\n"))
-        )
         lines = content.split("\n")
-        findings_count = 0
+        logger.debug("Starting generator content scan, %d lines to process", len(lines))
+        yield from SecretScanner._scan_lines(lines)
+        logger.debug("Generator content scan completed")
+
+    @staticmethod
+    def _scan_lines(lines: Iterable[str]) -> Generator[SecretFinding, None, None]:
+        """Scan lines one at a time, yielding findings as they are found.
+
+        Shared by content and file scanning so that files can be streamed
+        without first being read into a single string.
+
+        Args:
+            lines: Lines to scan, without trailing newline characters.
+
+        Yields:
+            SecretFinding: Individual secret findings as they are discovered.
+        """
+        for line_num, line, match, secret_type, severity in SecretScanner._iter_matches(lines):
+            yield SecretFinding(
+                secret_type=secret_type,
+                # Redact the matched text for safety
+                matched_text=SecretScanner._redact_secret(match.group(0)),
+                line_number=line_num,
+                column=match.start() + 1,
+                severity=severity,
+                context=line.strip()[:50],  # First 50 chars of line
+            )
+
+    @staticmethod
+    def _iter_matches(lines: Iterable[str]) -> Generator[RawMatch, None, None]:
+        """Yield accepted pattern matches without building SecretFinding objects.
+
+        Overlapping matches and false positives are already filtered out, so
+        every yielded match corresponds to exactly one finding.
+
+        Args:
+            lines: Lines to scan, without trailing newline characters.
+
+        Yields:
+            RawMatch: (line_number, line, match, secret_type, severity) tuples.
+        """
+        matches_count = 0
 
         for line_num, line in enumerate(lines, start=1):
             # Track occupied spans to prevent duplicate findings from overlapping patterns
             occupied_spans: list[tuple[int, int]] = []
 
-            for pattern, secret_type, severity in SecretScanner.PATTERNS:
-                matches = pattern.finditer(line)
+            # Single-pass pre-check: no individual pattern can match if the combined one
+            # doesn't. Only lines that pass are narrowed down by their required literals
+            candidate_patterns = (
+                SecretScanner._literal_candidates(line)
+                if SecretScanner.COMBINED_PATTERN.search(line)
+                else []
+            )
 
-                for match in matches:
-                    matched_text = match.group(0)
+            for pattern, secret_type, severity in candidate_patterns:
+                for match in pattern.finditer(line):
                     match_start = match.start()
                     match_end = match.end()
 
@@ -243,37 +367,49 @@ class SecretScanner:
                         continue
 
                     # Check for false positives
-                    if SecretScanner._is_false_positive(matched_text, line):
+                    if SecretScanner._is_false_positive(match.group(0), line):
                         continue
 
-                    # Redact the matched text for safety
-                    redacted_text = SecretScanner._redact_secret(matched_text)
-
-                    finding = SecretFinding(
-                        secret_type=secret_type,
-                        matched_text=redacted_text,
-                        line_number=line_num,
-                        column=match_start + 1,
-                        severity=severity,
-                        context=line.strip()[:50],  # First 50 chars of line
-                    )
-                    findings_count += 1
+                    matches_count += 1
                     # Mark this span as occupied
                     occupied_spans.append((match_start, match_end))
-                    yield finding
+                    yield line_num, line, match, secret_type, severity
 
             # Throttled logging: only log every 100 lines to reduce noise
             if line_num % 100 == 0:
-                logger.debug("Scanned line %d: total findings so far: %d", line_num, findings_count)
+                logger.debug("Scanned line %d: total findings so far: %d", line_num, matches_count)
 
-        logger.debug("Generator content scan completed")
+    @staticmethod
+    def _literal_candidates(line: str) -> list[PatternDef]:
+        """Select the patterns whose required literals occur in a line.
+
+        Args:
+            line: Line of text about to be scanned.
+
+        Returns:
+            list[PatternDef]: Patterns that may match the line, in PATTERNS order.
+        """
+        folded = line.casefold()
+        candidates: list[PatternDef] = []
+        for pattern_def in SecretScanner.PATTERNS:
+            pattern, secret_type, _severity = pattern_def
+            literals = SecretScanner.PATTERN_LITERALS.get(secret_type)
+            if literals is not None:
+                haystack = folded if pattern.flags & re.IGNORECASE else line
+                if not any(literal in haystack for literal in literals):
+                    continue
+            candidates.append(pattern_def)
+        return candidates
 
     @staticmethod
-    def scan_file(file_path: Path, config: "SecurityConfig | None" = None) -> list[SecretFinding]:
+    def scan_file(
+        file_path: FileSource, config: "SecurityConfig | None" = None
+    ) -> list[SecretFinding]:
         """Scan a file for potential secrets.
 
         Args:
-            file_path: Path to the file to scan.
+            file_path: Path to the file to scan (Path, str or os.PathLike), or an open
+                text stream such as io.StringIO.
             config: Optional SecurityConfig to use for scanning behavior.
                     If None or enable_secret_scanning is True, scanning proceeds.
                     If enable_secret_scanning is False, returns empty list.
@@ -285,18 +421,91 @@ class SecretScanner:
             FileNotFoundError: If file does not exist.
             OSError: If file cannot be read.
         """
-        if not file_path.exists():
+        findings = list(SecretScanner.scan_file_generator(file_path, config=config))
+        logger.debug("Finished scanning %s: %d findings", file_path, len(findings))
+        return findings
+
+    @staticmethod
+    def scan_file_generator(
+        file_path: FileSource, config: "SecurityConfig | None" = None
+    ) -> Generator[SecretFinding, None, None]:
+        """Scan a file for potential secrets, yielding findings as they are found.
+
+        The file is read line by line, so memory use does not grow with file
+        size and iteration can stop at the first finding without reading the
+        rest of the file.
+
+        Args:
+            file_path: Path to the file to scan (Path, str or os.PathLike), or an
+                open text stream such as io.StringIO. Streams are read as-is and are
+                not closed.
+            config: Optional SecurityConfig to use for scanning behavior.
+                    If None or enable_secret_scanning is True, scanning proceeds.
+                    If enable_secret_scanning is False, nothing is yielded.
+
+        Yields:
+            SecretFinding: Individual secret findings as they are discovered.
+
+        Raises:
+            FileNotFoundError: If file does not exist.
+            OSError: If file cannot be read.
+        """
+        if isinstance(file_path, str | os.PathLike):
+            file_path = Path(file_path)
+        if isinstance(file_path, Path) and not file_path.exists():
             raise FileNotFoundError(f"File not found: {file_path.resolve()}")
 
+        # Check if secret scanning is disabled in config
+        if config and not config.enable_secret_scanning:
+            logger.debug("Secret scanning disabled by configuration")
+            return
+
         try:
             logger.debug("Scanning file for secrets: %s", file_path)
-            content = file_path.read_text(encoding="utf-8", errors="ignore")
-            findings = SecretScanner.scan_content(content, config=config)
-            logger.debug("Finished scanning %s: %d findings", file_path, len(findings))
-            return findings
+            if isinstance(file_path, Path):
+                # Universal newlines turn CR and CRLF endings into "\n", as read_text does
+                with file_path.open(encoding="utf-8", errors="ignore") as handle:
+                    yield from SecretScanner._scan_stream(handle)
+            else:
+                yield from SecretScanner._scan_stream(file_path)
         except OSError as e:
             logger.exception("Failed to read file %s", file_path)
-            raise OSError(f"Failed to read file {file_path.resolve()}: {e}") from e
+            location = file_path.resolve() if isinstance(file_path, Path) else file_path
+            raise OSError(f"Failed to read file {location}: {e}") from e
+
+    @staticmethod
+    def _scan_stream(stream: TextIO) -> Generator[SecretFinding, None, None]:
+        """Scan an open text stream line by line.
+
+        Args:
+            stream: Text stream to read lines from.
+
+        Yields:
+            SecretFinding: Individual secret findings as they are discovered.
+        """
+        yield from SecretScanner._scan_lines(line.rstrip("\r\n") for line in stream)
+
+    @staticmethod
+    def has_secrets_in_file(
+        file_path: FileSource, config: "SecurityConfig | None" = None
+    ) -> bool:
+        """Check if a file contains any secrets, stopping at the first one.
+
+        Args:
+            file_path: Path to the file to check, or an open text stream.
+            config: Optional SecurityConfig to use for scanning behavior.
+                    If None or enable_secret_scanning is True, scanning proceeds.
+                    If enable_secret_scanning is False, returns False.
+
+        Returns:
+            bool: True if any secrets are found, False otherwise.
+
+        Raises:
+            FileNotFoundError: If file does not exist.
+            OSError: If file cannot be read.
+        """
+        with closing(SecretScanner.scan_file_generator(file_path, config=config)) as findings:
+            return next(findings, None) is not None
 
     @staticmethod
     def _is_false_positive(matched_text: str, context: str) -> bool:
@@ -315,7 +524,7 @@ class SecretScanner:
                 # Log only numeric metadata - no secret-like content
                 match_length = len(matched_text)
                 context_length = len(context)
-                has_special_chars = any(c in context for c in ["#", "//", "/*", "<!--"])
+                has_special_chars = any(c in context for c in SecretScanner.COMMENT_MARKERS)
 
                 logger.debug(
                     "False positive detected: match_length=%d, context_length=%d, has_comment=%s",
@@ -327,13 +536,8 @@ class SecretScanner:
 
         # Check if it's in a comment or documentation
         context_lower = context.lower()
-        has_comment_marker = any(
-            marker in context_lower
-            for marker in ["#", "//", "/*", "<!--", "example:", "e.g.", "```"]
-        )
-        has_test_keyword = any(
-            keyword in context_lower for keyword in ["example", "test", "dummy", "sample"]
-        )
+        has_comment_marker = any(marker in context_lower for marker in SecretScanner.DOC_MARKERS)
+        has_test_keyword = any(keyword in context_lower for keyword in SecretScanner.TEST_KEYWORDS)
         return has_comment_marker and has_test_keyword
 
     @staticmethod
@@ -370,7 +574,9 @@ class SecretScanner:
             logger.debug("Secret scanning disabled by configuration, skipping has_secrets check")
             return False
 
-        return bool(SecretScanner.scan_content(content, stop_on_first=True, config=config))
+        # Stop at the first accepted match; no SecretFinding is built or redacted
+        matches = SecretScanner._iter_matches(content.split("\n"))
+        return next(matches, None) is not None
 
     @staticmethod
     def get_summary(findings: list[SecretFinding]) -> SummaryDict:
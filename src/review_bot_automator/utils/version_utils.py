@@ -9,6 +9,32 @@ files to ensure proper dependency pinning for security.
 import re
 from dataclasses import dataclass
 
+# Any acceptable version constraint.
+# PEP 440 compliance adjustments:
+# - '===' accepts arbitrary string (non-numeric identifiers allowed), no '*'
+# - '*' allowed only for '==' and '!=', as trailing wildcard (e.g. 1.2.* or 1.*)
+#   We do not fully validate position here; stricter checks handled in
+#   validate_version_constraint when require_exact_pin.
+_VERSION_CONSTRAINT_RE = re.compile(
+    r"("  # start group
+    r"===\s*[^*\s]+"  # identity, any non-space string without '*'
+    r"|"  # or
+    r"(==|!=)\s*\d[0-9A-Za-z.+-]*(?:\.\*)?"  # equality/inequality with optional trailing '.*'
+    r"|"  # or
+    r"~=\s*\d[0-9A-Za-z.+\-]*"  # compatible release, no '*'
+    r"|"  # or
+    r"(>=|<=|>|<)\s*\d[0-9A-Za-z.+\-]*"  # ranges, no '*'
+    r")"
+)
+
+# Exact pins accepted for production requirements
+_IDENTITY_PIN_RE = re.compile(r"===\s*[^*\s]+")
+_COMPATIBLE_PIN_RE = re.compile(r"~=\s*\d[0-9A-Za-z.+\-]*")
+_EQUALITY_PIN_RE = re.compile(r"==\s*([0-9A-Za-z.+\-.*]+)")
+
+# Version core before a trailing '.*' wildcard (PEP 440 segment approximation)
+_WILDCARD_CORE_RE = re.compile(r"\d+(?:\.\d+)*")
+
 
 @dataclass
 class ValidationResult:
@@ -59,25 +85,6 @@ def validate_version_constraint(
     # Strip inline comments to avoid false positives
     line_without_comment = line.split("#", 1)[0].rstrip()
 
-    # Check if version is pinned or has reasonable constraints
-    # PEP 440 compliance adjustments:
-    # - '===' accepts arbitrary string (non-numeric identifiers allowed), no '*'
-    # - '*' allowed only for '==' and '!=', as trailing wildcard (e.g. 1.2.* or 1.*)
-    #   We do not fully validate position here; stricter checks handled below when
-    #   require_exact_pin.
-    version_pattern = (
-        r"("  # start group
-        r"===\s*[^*\s]+"  # identity, any non-space string without '*'
-        r"|"  # or
-        r"(==|!=)\s*\d[0-9A-Za-z.+-]*(?:\.\*)?"  # equality/inequality with optional trailing '.*'
-        r"|"  # or
-        r"~=\s*\d[0-9A-Za-z.+\-]*"  # compatible release, no '*'
-        r"|"  # or
-        r"(>=|<=|>|<)\s*\d[0-9A-Za-z.+\-]*"  # ranges, no '*'
-        r")"
-    )
-    has_version_constraint = bool(re.search(version_pattern, line_without_comment))
-
     if require_exact_pin:
         # For production requirements.txt, require exact pinning (==, ~=, or ===)
         # - '===' must not include '*', accepts arbitrary identifier
@@ -85,25 +92,28 @@ def validate_version_constraint(
         # - '==' may include trailing wildcard only on final segment: v*, or 1.* or 1.2.*
         exact_pin_ok = False
 
-        # Identity pin
-        if re.search(r"===\s*[^*\s]+", line_without_comment) or re.search(
-            r"~=\s*\d[0-9A-Za-z.+\-]*", line_without_comment
-        ):
-            exact_pin_ok = True
-        # Equality with optional trailing wildcard on final segment
-        else:
-            m = re.search(r"==\s*([0-9A-Za-z.+\-.*]+)", line_without_comment)
-            if m:
-                ver = m.group(1)
-                if "*" not in ver:
-                    exact_pin_ok = True
-                else:
-                    # allow only forms like '1.*' or '1.2.*' (no middle wildcards like '1.*.2')
-                    if ver.endswith(".*") and ver.count("*") == 1:
-                        core = ver[:-2]
-                        # core must be digits and dots (PEP 440 segment approximation)
-                        if re.fullmatch(r"\d+(?:\.\d+)*", core):
-                            exact_pin_ok = True
+        # Every exact pin contains '==' (also part of '===') or '~=', so a plain
+        # substring check rules out unpinned lines before any regex runs
+        if "==" in line_without_comment or "~=" in line_without_comment:
+            # Identity pin
+            if _IDENTITY_PIN_RE.search(line_without_comment) or _COMPATIBLE_PIN_RE.search(
+                line_without_comment
+            ):
+                exact_pin_ok = True
+            # Equality with optional trailing wildcard on final segment
+            else:
+                m = _EQUALITY_PIN_RE.search(line_without_comment)
+                if m:
+                    ver = m.group(1)
+                    if "*" not in ver:
+                        exact_pin_ok = True
+                    else:
+                        # allow only forms like '1.*' or '1.2.*' (no middle wildcards like '1.*.2')
+                        if ver.endswith(".*") and ver.count("*") == 1:
+                            core = ver[:-2]
+                            # core must be digits and dots (PEP 440 segment approximation)
+                            if _WILDCARD_CORE_RE.fullmatch(core):
+                                exact_pin_ok = True
 
         if not exact_pin_ok:
             return ValidationResult(
@@ -117,7 +127,14 @@ def validate_version_constraint(
         return ValidationResult(is_valid=True, message="")
     else:
         # For dev requirements, allow range constraints but require some constraint
-        if not has_version_constraint:
+        # Check if version is pinned or has reasonable constraints; every operator
+        # contains '=', '<' or '>', so lines without them skip the regex
+        has_operator = (
+            "=" in line_without_comment
+            or "<" in line_without_comment
+            or ">" in line_without_comment
+        )
+        if not has_operator or not _VERSION_CONSTRAINT_RE.search(line_without_comment):
             return ValidationResult(
                 is_valid=False,
                 message=(
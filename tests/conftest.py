@@ -19,6 +19,27 @@ from review_bot_automator.handlers.toml_handler import TomlHandler
 from review_bot_automator.handlers.yaml_handler import YamlHandler
 
 
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Register the --no-network option for offline test runs."""
+    parser.addoption(
+        "--no-network",
+        action="store_true",
+        default=False,
+        help="Skip tests marked 'network' (e.g. when running offline)",
+    )
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]) -> None:
+    """Skip network-marked tests when --no-network is given."""
+    if not config.getoption("--no-network"):
+        return
+
+    skip_network = pytest.mark.skip(reason="network access disabled via --no-network")
+    for item in items:
+        if "network" in item.keywords:
+            item.add_marker(skip_network)
+
+
 @pytest.fixture
 def sample_pr_comments() -> dict[str, Any]:
     """
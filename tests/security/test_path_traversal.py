@@ -4,9 +4,10 @@ This module tests that handlers and the resolver properly handle path traversal
 to prevent directory traversal vulnerabilities.
 """
 
-import tempfile
-from collections.abc import Generator
+import sys
+from collections.abc import Mapping
 from pathlib import Path
+from types import MappingProxyType
 
 import pytest
 
@@ -17,72 +18,187 @@ from review_bot_automator.handlers.json_handler import JsonHandler
 from review_bot_automator.handlers.toml_handler import TomlHandler
 from review_bot_automator.handlers.yaml_handler import YamlHandler
 
+# Absolute path outside any test workspace, chosen per platform
+_OUTSIDE_FILE = (
+    Path(r"C:\Windows\System32\drivers\etc\hosts")
+    if sys.platform == "win32"
+    else Path("/etc/passwd")
+)
+
+# Malicious path corpus as (label, path) pairs; Unicode variants live in UNICODE_TRAVERSALS
+TRAVERSAL_VECTORS: tuple[tuple[str, str], ...] = (
+    ("unix", "../../../etc/passwd"),
+    ("unix", "./../../etc/shadow"),
+    ("unix", "../../../root/.ssh/id_rsa"),
+    ("win", "..\\..\\..\\windows\\system32"),
+    ("win", "..\\..\\..\\boot.ini"),
+    ("win", "C:\\Windows\\System32\\config\\sam"),
+    ("urlenc", "..%2F..%2Fetc%2Fpasswd"),
+    ("dblenc", "..%252F..%252Fetc%252Fpasswd"),
+    ("urlenc_dots", "%2e%2e%2f%2e%2e%2fetc%2fpasswd"),
+    ("utf8", "..%c0%af..%c0%afetc%c0%afpasswd"),
+)
+
+# Unicode attack vectors that normalize to '..' or similar
+UNICODE_TRAVERSALS: tuple[str, ...] = (
+    # Fullwidth dots that normalize to '..'
+    "\uff0e\uff0e/etc/passwd",
+    # Fullwidth dots with slashes
+    "\uff0e\uff0e/\uff0e\uff0e/etc/passwd",
+    # Multiple fullwidth dot variations
+    "file\uff0e\uff0e/etc/passwd",
+    # Mixed fullwidth and regular dots
+    "\uff0e./etc/passwd",
+    # Regular dots (normalized form)
+    "\u002e\u002e/etc/passwd",  # Regular dots
+    "\u002e\u002e/\u002e\u002e/etc/passwd",  # Multiple regular dots
+)
+
+# Minimal valid content per file type
+_VALID_CONTENT: Mapping[str, str] = MappingProxyType(
+    {
+        "json": '{"key": "value"}',
+        "yaml": "key: value",
+        "toml": 'key = "value"',
+    }
+)
+
+
+@pytest.fixture(scope="module")
+def workspace_root(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create one temporary workspace seeded with a test file per file type."""
+    base_path = tmp_path_factory.mktemp("sec")
+    for file_type, content in _VALID_CONTENT.items():
+        (base_path / f"test.{file_type}").write_text(
+            content + ("\n" if file_type != "json" else "")
+        )
+    return base_path
+
+
+# The handler fixtures below shadow the conftest ones and are shared by the whole
+# module, so tests must only exercise rejection paths. They stay rooted in the
+# temporary workspace so a regressed rejection can never write to the checkout.
+@pytest.fixture(scope="module")
+def json_handler(workspace_root: Path) -> JsonHandler:
+    """Create the JSON handler shared by this module."""
+    return JsonHandler(workspace_root=str(workspace_root))
+
+
+@pytest.fixture(scope="module")
+def yaml_handler(workspace_root: Path) -> YamlHandler:
+    """Create the YAML handler shared by this module."""
+    return YamlHandler(workspace_root=str(workspace_root))
+
+
+@pytest.fixture(scope="module")
+def toml_handler(workspace_root: Path) -> TomlHandler:
+    """Create the TOML handler shared by this module."""
+    return TomlHandler(workspace_root=str(workspace_root))
+
+
+@pytest.fixture(params=list(_VALID_CONTENT))
+def file_type(request: pytest.FixtureRequest) -> str:
+    """Parametrize a test over each handler file type."""
+    return str(request.param)
+
+
+@pytest.fixture
+def handler(request: pytest.FixtureRequest, file_type: str) -> BaseHandler:
+    """Return the shared handler fixture for the current file type."""
+    shared_handler: BaseHandler = request.getfixturevalue(f"{file_type}_handler")
+    return shared_handler
+
+
+@pytest.fixture
+def outside_file() -> Path:
+    """Return an absolute path outside any test workspace for the current platform."""
+    return _OUTSIDE_FILE
+
+
+@pytest.fixture(scope="module")
+def symlinks(workspace_root: Path) -> dict[str, Path]:
+    """Create symlinks in the workspace that escape it.
+
+    Returns:
+        Mapping with one ``link.<type>`` symlink per file type pointing at an
+        outside file, and ``parent_attack``: a file path whose parent directory
+        is a symlink to an outside directory.
+    """
+    links = {file_type: workspace_root / f"link.{file_type}" for file_type in _VALID_CONTENT}
+    evil_symlink = workspace_root / "evil_symlink"
+    try:
+        for link in links.values():
+            link.symlink_to(_OUTSIDE_FILE)
+        evil_symlink.symlink_to(_OUTSIDE_FILE.parent)
+    except OSError:
+        pytest.skip("Cannot create symlink (permissions issue)")
+    return {**links, "parent_attack": evil_symlink / "nested" / "config.toml"}
+
+
+_EMPTY_METADATA: Mapping[str, object] = MappingProxyType({})
+
+
+def _mk_change(
+    path: str,
+    *,
+    content: str = "x",
+    file_type: FileType = FileType.JSON,
+    fingerprint: str | None = None,
+) -> Change:
+    """Build a single-line Change sharing one immutable empty metadata mapping."""
+    return Change(
+        path=path,
+        start_line=1,
+        end_line=1,
+        content=content,
+        metadata=_EMPTY_METADATA,
+        fingerprint=fingerprint or path,
+        file_type=file_type,
+    )
+
+
+@pytest.fixture(scope="class")
+def resolver() -> ConflictResolver:
+    """Share one resolver per test class; detect_conflicts keeps no per-call state."""
+    return ConflictResolver()
+
+
+@pytest.fixture(scope="class")
+def malicious_changes() -> tuple[Change, ...]:
+    """Build the plain traversal changes once per test class (Change is frozen)."""
+    return (
+        _mk_change("../../../etc/passwd", content="malicious1", fingerprint="test1"),
+        _mk_change(
+            "../../root/.ssh/id_rsa",
+            content="malicious2",
+            file_type=FileType.YAML,
+            fingerprint="test2",
+        ),
+    )
+
+
+@pytest.fixture(scope="class")
+def unicode_changes() -> tuple[Change, ...]:
+    """Build one change per Unicode traversal vector once per test class."""
+    return tuple(
+        _mk_change(attack_path, content="malicious", fingerprint=f"test-{attack_path}")
+        for attack_path in UNICODE_TRAVERSALS
+    )
+
 
 class TestHandlerPathTraversal:
     """Tests for handler path traversal prevention."""
 
-    def _create_handler_and_content(
-        self, file_type: str, base_path: Path
-    ) -> tuple[JsonHandler | YamlHandler | TomlHandler, str]:
-        """Create handler and content for given file type.
-
-        Args:
-            file_type: Type of file ("json", "yaml", or "toml")
-            base_path: Base path for the handler workspace
-
-        Returns:
-            Tuple of (handler, content) for the file type
-        """
-        if file_type == "json":
-            return JsonHandler(workspace_root=str(base_path)), '{"key": "value"}'
-        elif file_type == "yaml":
-            return YamlHandler(workspace_root=str(base_path)), "key: value"
-        else:  # toml
-            return TomlHandler(workspace_root=str(base_path)), 'key = "value"'
-
-    @pytest.fixture(params=["json", "yaml", "toml"])
-    def setup_test_files(
-        self, request: pytest.FixtureRequest
-    ) -> Generator[tuple[Path, Path, Path, str], None, None]:
-        """Create temporary directory with test file for different file types.
-
-        Returns:
-            A tuple of (base_path, test_file, outside_file, file_type) where:
-            - base_path: Temporary base directory Path
-            - test_file: Created test file Path (e.g., test.json/test.yaml/test.toml)
-            - outside_file: Outside file Path (e.g., /etc/passwd)
-            - file_type: File type string ("json", "yaml", or "toml")
-        """
-        file_type = request.param
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            base_path = Path(tmpdir)
-            outside_file = Path("/etc/passwd")
-
-            # Create appropriate test file based on type
-            if file_type == "json":
-                test_file = base_path / "test.json"
-                test_file.write_text('{"key": "value"}')
-            elif file_type == "yaml":
-                test_file = base_path / "test.yaml"
-                test_file.write_text("key: value\n")
-            elif file_type == "toml":
-                test_file = base_path / "test.toml"
-                test_file.write_text('key = "value"\n')
-
-            yield base_path, test_file, outside_file, file_type
-
     def test_handlers_reject_unix_path_traversal(
-        self, setup_test_files: tuple[Path, Path, Path, str]
+        self, handler: BaseHandler, workspace_root: Path, file_type: str
     ) -> None:
         """Test that handlers reject Unix-style path traversal."""
-        base_path, test_file, _, file_type = setup_test_files
-
-        # Create handler and content using helper function
-        handler, content = self._create_handler_and_content(file_type, base_path)
+        content = _VALID_CONTENT[file_type]
 
         # Test valid path
-        assert handler.can_handle(str(test_file)), "Valid path should be handled"
+        assert handler.can_handle(
+            str(workspace_root / f"test.{file_type}")
+        ), "Valid path should be handled"
 
         # Test path traversal attempts
         assert not handler.apply_change(
@@ -98,11 +214,10 @@ class TestHandlerPathTraversal:
         ],
     )
     def test_json_handler_rejects_path_traversal_variants(
-        self, tmp_path: Path, attack_path: str
+        self, json_handler: JsonHandler, attack_path: str
     ) -> None:
         """Parametrized test covering Unix, Windows, and URL-encoded traversal paths."""
-        handler = JsonHandler(workspace_root=str(tmp_path))
-        assert not handler.apply_change(
+        assert not json_handler.apply_change(
             attack_path, '{"key": "value"}', 1, 1
         ), f"Path traversal should be rejected: {attack_path}"
 
@@ -120,140 +235,39 @@ class TestHandlerPathTraversal:
             "../../../etc/passwd", 'key = "value"', 1, 1
         ), "Path traversal should be rejected"
 
-    def test_handlers_reject_absolute_paths(
-        self, setup_test_files: tuple[Path, Path, Path, str], subtests: pytest.Subtests
-    ) -> None:
-        """Test that handlers reject absolute paths using subtests."""
-        base_path, _, outside_file, _file_type = setup_test_files
-        handlers = [
-            JsonHandler(workspace_root=str(base_path)),
-            YamlHandler(workspace_root=str(base_path)),
-            TomlHandler(workspace_root=str(base_path)),
-        ]
+    def test_handlers_reject_absolute_paths(self, handler: BaseHandler, outside_file: Path) -> None:
+        """Test that handlers reject absolute paths outside the workspace."""
+        assert not handler.apply_change(str(outside_file), "test content", 1, 1)
 
-        for handler in handlers:
-            with subtests.test(
-                msg=f"Handler: {handler.__class__.__name__}", handler=handler.__class__.__name__
-            ):
-                assert not handler.apply_change(
-                    str(outside_file), "test content", 1, 1
-                ), f"{handler.__class__.__name__} should reject absolute paths"
+    def test_handlers_reject_null_bytes_in_path(self, handler: BaseHandler) -> None:
+        """Test that handlers reject paths containing null bytes."""
+        assert not handler.apply_change("file\x00.txt", "test content", 1, 1)
 
-    def test_handlers_reject_null_bytes_in_path(
-        self, tmp_path: Path, subtests: pytest.Subtests
+    @pytest.mark.skipif(sys.platform == "win32", reason="POSIX symlink semantics")
+    def test_handlers_reject_symlink_attacks(
+        self, handler: BaseHandler, symlinks: dict[str, Path], file_type: str
     ) -> None:
-        """Test that handlers reject paths containing null bytes using subtests."""
-        handlers = [
-            JsonHandler(workspace_root=str(tmp_path)),
-            YamlHandler(workspace_root=str(tmp_path)),
-            TomlHandler(workspace_root=str(tmp_path)),
-        ]
+        """Test that handlers reject symlinks resolving outside the workspace."""
+        assert not handler.apply_change(str(symlinks[file_type]), _VALID_CONTENT[file_type], 1, 1)
 
-        for handler in handlers:
-            with subtests.test(
-                msg=f"Handler: {handler.__class__.__name__}", handler=handler.__class__.__name__
-            ):
-                assert not handler.apply_change(
-                    "file\x00.txt", "test content", 1, 1
-                ), f"{handler.__class__.__name__} should reject null bytes in path"
-
-    def test_handlers_reject_symlink_attacks(self, subtests: pytest.Subtests) -> None:
-        """Test that handlers handle symlink attacks using subtests."""
-        handlers = [
-            ("json", "link.json", '{"key": "value"}'),
-            ("yaml", "link.yaml", "key: value"),
-            ("toml", "link.toml", 'key = "value"'),
-        ]
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Create a symlink target outside the temp directory
-            symlink_target = Path("/etc/passwd")
-
-            try:
-                for kind, filename, content in handlers:
-                    with subtests.test(msg=f"Handler: {kind}", handler=kind):
-                        base_path = Path(tmpdir)
-                        # Instantiate handler with workspace_root bound to tmpdir
-                        if kind == "json":
-                            handler: BaseHandler = JsonHandler(workspace_root=str(base_path))
-                        elif kind == "yaml":
-                            handler = YamlHandler(workspace_root=str(base_path))
-                        else:
-                            handler = TomlHandler(workspace_root=str(base_path))
-
-                        # Create symlink within workspace pointing to external target
-                        handler_symlink = base_path / filename
-                        handler_symlink.unlink(missing_ok=True)
-                        try:
-                            handler_symlink.symlink_to(symlink_target)
-                        except OSError:
-                            pytest.skip("Cannot create symlink (permissions issue)")
-
-                        # The handler should validate the path properly and reject
-                        assert not handler.apply_change(
-                            str(handler_symlink), content, 1, 1
-                        ), f"{handler.__class__.__name__} should handle symlinks safely"
-
-                        # Clean up symlink for next iteration
-                        if handler_symlink.exists():
-                            handler_symlink.unlink()
-            finally:
-                pass
-
-    def test_handlers_reject_symlink_in_parent_directories(self) -> None:
+    @pytest.mark.skipif(sys.platform == "win32", reason="POSIX symlink semantics")
+    def test_handlers_reject_symlink_in_parent_directories(
+        self, toml_handler: TomlHandler, symlinks: dict[str, Path]
+    ) -> None:
         """Test that handlers reject files when any parent directory is a symlink."""
-        content = 'key = "value"'
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            base_path = Path(tmpdir)
-            handler = TomlHandler(workspace_root=str(base_path))
-
-            # Create a normal subdirectory structure
-            subdir = base_path / "subdir" / "nested"
-            subdir.mkdir(parents=True, exist_ok=True)
-
-            # Create a file within the nested directory
-            nested_file = subdir / "config.toml"
-            nested_file.write_text('name = "test"')
-
-            # Create a symlink pointing to /etc
-            symlink_target = Path("/etc")
-            symlink_parent = base_path / "evil_symlink"
-            symlink_target_file = symlink_parent / "nested" / "config.toml"
-
-            try:
-                symlink_parent.symlink_to(symlink_target)
-            except OSError:
-                pytest.skip("Cannot create symlink (permissions issue)")
-
-            try:
-                # Try to access a file where one parent is a symlink; provide workspace_root
-                assert not handler.apply_change(
-                    str(symlink_target_file), content, 1, 2
-                ), "Handler should reject path when parent directory is a symlink"
-            finally:
-                # Cleanup
-                if symlink_parent.exists():
-                    symlink_parent.unlink()
+        # Try to access a file where one parent is a symlink inside the workspace
+        assert not toml_handler.apply_change(
+            str(symlinks["parent_attack"]), 'key = "value"', 1, 2
+        ), "Handler should reject path when parent directory is a symlink"
 
 
 class TestResolverPathTraversal:
     """Tests for resolver path traversal prevention."""
 
-    def test_resolver_handles_path_traversal_in_changes(self) -> None:
+    def test_resolver_handles_path_traversal_in_changes(self, resolver: ConflictResolver) -> None:
         """Test that resolver handles path traversal attempts in changes."""
-        resolver = ConflictResolver()
-
         # Create a change with path traversal attempt
-        malicious_change = Change(
-            path="../../../etc/passwd",
-            start_line=1,
-            end_line=1,
-            content="test",
-            metadata={},
-            fingerprint="test",
-            file_type=FileType.JSON,
-        )
+        malicious_change = _mk_change("../../../etc/passwd", content="test", fingerprint="test")
 
         # Resolver should handle this gracefully
         conflicts = resolver.detect_conflicts([malicious_change])
@@ -274,148 +288,67 @@ class TestResolverPathTraversal:
             handler_rejected_path
         ), "Handler must unambiguously reject malicious paths to prevent path traversal"
 
-    def test_resolver_rejects_multiple_path_traversal_attempts(self) -> None:
+    def test_resolver_rejects_multiple_path_traversal_attempts(
+        self, resolver: ConflictResolver, malicious_changes: tuple[Change, ...]
+    ) -> None:
         """Test that resolver rejects multiple path traversal attempts."""
-        resolver = ConflictResolver()
-
-        changes = [
-            Change(
-                path="../../../etc/passwd",
-                start_line=1,
-                end_line=1,
-                content="malicious1",
-                metadata={},
-                fingerprint="test1",
-                file_type=FileType.JSON,
-            ),
-            Change(
-                path="../../root/.ssh/id_rsa",
-                start_line=1,
-                end_line=1,
-                content="malicious2",
-                metadata={},
-                fingerprint="test2",
-                file_type=FileType.YAML,
-            ),
-        ]
-
-        conflicts = resolver.detect_conflicts(changes)
+        conflicts = resolver.detect_conflicts(list(malicious_changes))
         assert conflicts is not None, "Resolver should handle multiple malicious paths"
         assert isinstance(conflicts, list), "Should return a list"
 
-    def test_resolver_handles_unicode_path_traversal(self, subtests: pytest.Subtests) -> None:
-        """Test that resolver handles Unicode path traversal attempts using subtests."""
-        resolver = ConflictResolver()
-        json_handler = JsonHandler()
-        yaml_handler = YamlHandler()
-        toml_handler = TomlHandler()
-
-        # Unicode attack vectors that normalize to '..' or similar
-        attack_paths = [
-            # Fullwidth dots that normalize to '..'
-            "\uff0e\uff0e/etc/passwd",
-            # Fullwidth dots with slashes
-            "\uff0e\uff0e/\uff0e\uff0e/etc/passwd",
-            # Multiple fullwidth dot variations
-            "file\uff0e\uff0e/etc/passwd",
-            # Mixed fullwidth and regular dots
-            "\uff0e./etc/passwd",
-            # Regular dots (normalized form)
-            "\u002e\u002e/etc/passwd",  # Regular dots
-            "\u002e\u002e/\u002e\u002e/etc/passwd",  # Multiple regular dots
+    def test_resolver_handles_unicode_path_traversal(
+        self,
+        resolver: ConflictResolver,
+        unicode_changes: tuple[Change, ...],
+        json_handler: JsonHandler,
+        yaml_handler: YamlHandler,
+        toml_handler: TomlHandler,
+    ) -> None:
+        """Test that resolver and handlers handle Unicode path traversal attempts."""
+        conflicts = resolver.detect_conflicts(list(unicode_changes))
+        assert conflicts is not None
+        assert isinstance(conflicts, list)
+
+        # Handlers must reject every Unicode path traversal attempt
+        survivors = [
+            (type(handler).__name__, attack_path)
+            for handler in (json_handler, yaml_handler, toml_handler)
+            for attack_path in UNICODE_TRAVERSALS
+            if handler.apply_change(attack_path, "malicious", 1, 1)
         ]
-
-        for attack_path in attack_paths:
-            with subtests.test(msg=f"Unicode path traversal: {attack_path!r}", path=attack_path):
-                change = Change(
-                    path=attack_path,
-                    start_line=1,
-                    end_line=1,
-                    content="malicious",
-                    metadata={},
-                    fingerprint=f"test-{attack_path}",
-                    file_type=FileType.JSON,
-                )
-
-                conflicts = resolver.detect_conflicts([change])
-                assert conflicts is not None
-                assert isinstance(conflicts, list)
-
-                # Handlers must reject Unicode path traversal attempts
-                assert not json_handler.apply_change(attack_path, "malicious", 1, 1)
-                assert not yaml_handler.apply_change(attack_path, "malicious", 1, 1)
-                assert not toml_handler.apply_change(attack_path, "malicious", 1, 1)
+        assert not survivors, survivors
 
 
 class TestCrossPlatformPathTraversal:
     """Cross-platform path traversal tests."""
 
-    def test_unix_and_windows_path_traversal(self, subtests: pytest.Subtests) -> None:
-        """Test both Unix and Windows path traversal styles using subtests."""
-        handler = JsonHandler()
-
-        unix_traversals = [
-            "../../../etc/passwd",
-            "./../../etc/shadow",
-            "../../../root/.ssh/id_rsa",
-        ]
-
-        windows_traversals = [
-            "..\\..\\..\\windows\\system32",
-            "..\\..\\..\\boot.ini",
-            "C:\\Windows\\System32\\config\\sam",
-        ]
-
-        for path in unix_traversals + windows_traversals:
-            platform = "Unix" if "/" in path else "Windows"
-            with subtests.test(msg=f"{platform} path traversal: {path}", path=path):
-                assert not handler.apply_change(path, '{"key": "value"}', 1, 1)
-
-    def test_encoded_path_traversal_variants(self, subtests: pytest.Subtests) -> None:
-        """Test various encoding schemes used for path traversal using subtests."""
-        handler = JsonHandler()
-
-        encoded_traversals = [
-            ("URL encoded", "..%2F..%2Fetc%2Fpasswd"),
-            ("Double URL encoded", "..%252F..%252Fetc%252Fpasswd"),
-            ("URL encoded dots/slashes", "%2e%2e%2f%2e%2e%2fetc%2fpasswd"),
-            ("UTF-8 encoded", "..%c0%af..%c0%afetc%c0%afpasswd"),
-        ]
-
-        for encoding_type, path in encoded_traversals:
-            with subtests.test(msg=f"{encoding_type}: {path}", encoding=encoding_type):
-                assert not handler.apply_change(path, '{"key": "value"}', 1, 1)
+    @pytest.mark.parametrize(("label", "path"), TRAVERSAL_VECTORS)
+    def test_path_traversal_vectors(self, json_handler: JsonHandler, label: str, path: str) -> None:
+        """Test Unix, Windows, and encoded path traversal styles."""
+        assert not json_handler.apply_change(
+            path, '{"key": "value"}', 1, 1
+        ), f"{label} path traversal should be rejected: {path}"
 
 
 class TestHandlerValidationMethods:
     """Test handler validation methods handle path traversal."""
 
-    def test_validate_change_rejects_path_traversal(self) -> None:
+    def test_validate_change_rejects_path_traversal(self, json_handler: JsonHandler) -> None:
         """Test that validate_change rejects path traversal."""
-        handler = JsonHandler()
-
-        valid, message = handler.validate_change("../../../etc/passwd", '{"key": "value"}', 1, 1)
+        valid, message = json_handler.validate_change(
+            "../../../etc/passwd", '{"key": "value"}', 1, 1
+        )
 
         assert not valid, "validate_change should reject path traversal"
         assert message, "Should provide error message for rejected path"
 
-    def test_detect_conflicts_handles_path_traversal(self) -> None:
+    def test_detect_conflicts_handles_path_traversal(self, json_handler: JsonHandler) -> None:
         """Test that detect_conflicts handles path traversal in changes."""
-        handler = JsonHandler()
-
         # This should not raise an error even with malicious path
-        conflicts = handler.detect_conflicts(
+        conflicts = json_handler.detect_conflicts(
             "../../../etc/passwd",
             [
-                Change(
-                    path="../../../etc/passwd",
-                    start_line=1,
-                    end_line=1,
-                    content='{"key": "value"}',
-                    metadata={},
-                    fingerprint="test",
-                    file_type=FileType.JSON,
-                ),
+                _mk_change("../../../etc/passwd", content='{"key": "value"}', fingerprint="test"),
             ],
         )
 
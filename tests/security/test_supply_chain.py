@@ -3,6 +3,7 @@
 This module tests dependency security, package validation, and supply chain attacks.
 """
 
+import functools
 import importlib.util
 import json
 import logging
@@ -11,69 +12,118 @@ import re
 import shutil
 import subprocess
 import tomllib
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Any
 
 import pytest
+from ruamel.yaml import YAML
+from ruamel.yaml.comments import CommentedMap, CommentedSeq
 
 from review_bot_automator.utils.version_utils import validate_version_constraint
 
 # Type alias for JSON dictionaries
 JSONDict = dict[str, object]
 
+# Requirements files checked for pinning, relative to the repository root
+_REQUIREMENTS_FILES = ("requirements.txt", "requirements-dev.txt")
 
-def _extract_json_boundaries(content: str, start_char: str, end_char: str) -> str:
-    """Extract JSON content between start and end characters.
+# Shared decoder and the characters that can open a JSON document in safety output
+_JSON_DECODER = json.JSONDecoder()
+_JSON_START_RE = re.compile(r"[{\[]")
+
+# Keys under which safety reports list vulnerabilities, in order of preference
+_VULNERABILITY_LIST_KEYS = ("vulnerabilities", "vulnerability", "issues", "findings")
+
+# Any of these marks a JSON object in the output as a safety report
+_REPORT_KEYS = (*_VULNERABILITY_LIST_KEYS, "ignored_vulnerabilities", "report_meta")
+
+# Field aliases across safety report formats, in order of preference
+_PACKAGE_KEYS = ("package", "name", "package_name")
+_VERSION_KEYS = ("installed_version", "version", "current_version")
+_VULN_ID_KEYS = ("vulnerability_id", "cve", "id")
+_ADVISORY_KEYS = ("advisory", "description", "summary")
+
+# GitHub Actions accepts both extensions for workflow files
+_WORKFLOW_SUFFIXES = (".yml", ".yaml")
+
+# Upper bound on threads used to read workflow files
+_WORKFLOW_READ_WORKERS = 8
+
+# Action references that are not fetched from a GitHub repository
+_NON_REPO_ACTION_PREFIXES = ("./", "../", "docker://")
+
+# Requirements lines that are neither blank nor comments. finditer over the
+# whole file keeps the skip check in the regex engine. read_text already turns
+# CRLF into "\n", and the callers strip surrounding whitespace from each match.
+_REQ_LINE_RE = re.compile(r"(?m)^(?![ \t]*(?:#|$)).+$")
+
+# Dependency lines with none of the operators ==, >=, <=, ~=, !=, ^ or ~, no "@"
+# anywhere (pip URL references), and no VCS/URL prefix. A bare "<", ">", "=" or
+# "!" does not count as a constraint. "." never matches a newline, so each
+# lookahead stays on one line.
+_UNCONSTRAINED_DEP_RE = re.compile(
+    r"(?m)^(?!.*(?:[=!<>]=|[\^~@]))(?!(?:git|hg|svn|bzr)\+|https?://).+$"
+)
+
+# Direct URL installs: any git+ or plain http URL, or https outside PyPI
+_DANGEROUS_URL_RE = re.compile(
+    r"git\+|http://|https://(?!(?:files\.pythonhosted\.org|pypi\.org)(?:[:/]|$))"
+)
+
+
+def _is_safety_report(value: object) -> bool:
+    """Check whether a decoded JSON value has the shape of a safety report.
 
     Args:
-        content: The content to extract from
-        start_char: Opening character (e.g., '{' or '[')
-        end_char: Closing character (e.g., '}' or ']')
+        value: Decoded JSON value.
 
     Returns:
-        Extracted JSON substring, or an empty string if the start character is not
-        present, the end character occurs before the start, or no valid JSON
-        boundaries are found.
+        True for an object carrying any report key, or a non-empty list of
+        vulnerability objects.
     """
-    start_idx = content.find(start_char)
-    if start_idx < 0:
-        return ""
+    if isinstance(value, dict):
+        return any(key in value for key in _REPORT_KEYS)
+    if isinstance(value, list):
+        return bool(value) and all(isinstance(item, dict) for item in value)
+    return False
 
-    end_idx = content.rfind(end_char)
-    if end_idx < start_idx:
-        return ""
 
-    return content[start_idx : end_idx + 1]
+def _parse_safety_json(stdout: bytes) -> JSONDict | None:
+    """Parse JSON from safety command output.
 
-
-def _parse_safety_json(stdout: str) -> JSONDict | None:
-    """Parse JSON from safety command output using multiple strategies.
+    json.loads accepts bytes directly, so the output is never decoded as a
+    whole unless it carries non-JSON noise around the report.
 
     Args:
-        stdout: Raw stdout from safety command.
+        stdout: Raw stdout bytes from safety command.
 
     Returns:
         Parsed JSON dict, or None if parsing failed.
     """
     stdout_content = stdout.strip()
-    safety_data = None
-
-    # Try multiple JSON extraction strategies
-    strategies = [
-        stdout_content,  # Full stripped stdout
-        _extract_json_boundaries(stdout_content, "{", "}"),  # First '{' to last '}'
-        _extract_json_boundaries(stdout_content, "[", "]"),  # First '[' to last ']'
-    ]
 
-    for strategy_content in strategies:
-        if not strategy_content:
-            continue
+    # Fast path: the full stripped stdout is usually valid JSON on its own
+    try:
+        safety_data: JSONDict | None = json.loads(stdout_content)
+        return safety_data
+    except ValueError:  # JSONDecodeError or undecodable bytes
+        pass
+
+    # Fall back to the first "{" or "[" that starts a complete, report-shaped
+    # document; raw_decode stops at its end, so trailing output is ignored.
+    # Log lines such as "Results: []" decode fine but are not reports.
+    text = stdout_content.decode("utf-8", "replace")
+    for start in _JSON_START_RE.finditer(text):
         try:
-            safety_data = json.loads(strategy_content)
-            break  # Success, exit the loop
-        except json.JSONDecodeError:
-            continue  # Try next strategy
+            safety_data, _ = _JSON_DECODER.raw_decode(text, start.start())
+        except ValueError:
+            continue  # Bracket belongs to a log line, try the next one
+        if _is_safety_report(safety_data):
+            return safety_data
 
-    return safety_data
+    return None
 
 
 def _extract_vulnerabilities(
@@ -94,7 +144,7 @@ def _extract_vulnerabilities(
         vulnerabilities = [v for v in data if isinstance(v, dict)]
     elif isinstance(data, dict):
         # Check common keys for vulnerability data
-        for key in ["vulnerabilities", "vulnerability", "issues", "findings"]:
+        for key in _VULNERABILITY_LIST_KEYS:
             if key in data:
                 value = data[key]
                 if isinstance(value, list):
@@ -111,7 +161,7 @@ def _extract_vulnerabilities(
 
 
 def _parse_vulnerability_report(
-    result: subprocess.CompletedProcess[str],
+    result: subprocess.CompletedProcess[bytes],
 ) -> tuple[list[JSONDict], list[JSONDict], str | None]:
     """Parse vulnerability report from safety command output.
 
@@ -130,7 +180,7 @@ def _parse_vulnerability_report(
         if safety_data is None:
             logging.warning(
                 "Failed to parse safety JSON output, using fallback: %s",
-                result.stdout[:200] if result.stdout else "empty",
+                result.stdout[:200].decode("utf-8", "replace"),
             )
             return [], [], "Failed to parse safety JSON output"
 
@@ -177,6 +227,23 @@ def _validate_no_vulnerabilities(vulnerabilities: list[JSONDict], ignored: list[
         )
 
 
+def _first_present(data: JSONDict, keys: tuple[str, ...], default: object) -> object:
+    """Return the value of the first key present in data.
+
+    Args:
+        data: Dictionary to look up.
+        keys: Candidate keys, in order of preference.
+        default: Value returned when none of the keys is present.
+
+    Returns:
+        The value of the first present key, or default.
+    """
+    for key in keys:
+        if key in data:
+            return data[key]
+    return default
+
+
 def _format_vulnerability_details(
     vulnerabilities: list[JSONDict], is_ignored: bool = False
 ) -> list[str]:
@@ -191,32 +258,23 @@ def _format_vulnerability_details(
     """
     vulnerability_details = []
 
-    for vuln in vulnerabilities:
-        if isinstance(vuln, dict):
-            package = vuln.get("package", vuln.get("name", vuln.get("package_name", "unknown")))
-            version = vuln.get(
-                "installed_version",
-                vuln.get("version", vuln.get("current_version", "unknown")),
-            )
-            vulnerability_id = vuln.get(
-                "vulnerability_id", vuln.get("cve", vuln.get("id", "unknown"))
+    for vuln in (v for v in vulnerabilities if isinstance(v, dict)):
+        package = _first_present(vuln, _PACKAGE_KEYS, "unknown")
+        version = _first_present(vuln, _VERSION_KEYS, "unknown")
+        vulnerability_id = _first_present(vuln, _VULN_ID_KEYS, "unknown")
+        advisory = _first_present(vuln, _ADVISORY_KEYS, "No advisory available")
+
+        if is_ignored:
+            ignored_reason = vuln.get("ignored_reason", "Ignored")
+            vulnerability_details.append(
+                f"  • {package}=={version} - {vulnerability_id}: "
+                f"{advisory} (IGNORED: {ignored_reason})"
             )
-            advisory = vuln.get(
-                "advisory",
-                vuln.get("description", vuln.get("summary", "No advisory available")),
+        else:
+            vulnerability_details.append(
+                f"  • {package}=={version} - {vulnerability_id}: {advisory}"
             )
 
-            if is_ignored:
-                ignored_reason = vuln.get("ignored_reason", "Ignored")
-                vulnerability_details.append(
-                    f"  • {package}=={version} - {vulnerability_id}: "
-                    f"{advisory} (IGNORED: {ignored_reason})"
-                )
-            else:
-                vulnerability_details.append(
-                    f"  • {package}=={version} - {vulnerability_id}: {advisory}"
-                )
-
     return vulnerability_details
 
 
@@ -231,31 +289,70 @@ def _extract_string_dependencies(
     Returns:
         List of dependency strings extracted from the data structure.
     """
-    result: list[str] = []
+    # tomllib only produces plain dict/list/str, so exact type checks are enough
+    if type(deps_data) is str:
+        return [deps_data]
+
+    entries: Iterable[object]
+    if type(deps_data) is dict:
+        entries = deps_data.values()
+    elif type(deps_data) is list:
+        entries = deps_data
+    else:
+        return []
 
-    if isinstance(deps_data, dict):
-        for value in deps_data.values():
-            if isinstance(value, str):
-                result.append(value)
-            elif (
-                isinstance(value, dict) and "version" in value and isinstance(value["version"], str)
-            ):
-                result.append(value["version"])
-    elif isinstance(deps_data, list):
-        for item in deps_data:
-            if isinstance(item, str):
-                result.append(item)
-            elif isinstance(item, dict) and "version" in item and isinstance(item["version"], str):
-                result.append(item["version"])
-    elif isinstance(deps_data, str):
-        result.append(deps_data)
+    result: list[str] = []
+    for entry in entries:
+        if type(entry) is str:
+            result.append(entry)
+            continue
+        # Table form: {version = "..."}
+        version = entry.get("version") if type(entry) is dict else None
+        if isinstance(version, str):
+            result.append(version)
 
     return result
 
 
+def _iter_uses(node: object) -> Iterator[tuple[str, int]]:
+    """Yield every string ``uses:`` value in a round-trip parsed workflow.
+
+    Walking the parsed document covers job-level reusable workflows and step
+    actions alike, and never mistakes text inside ``run:`` scripts for a step.
+
+    Args:
+        node: Node from ruamel's round-trip loader (mapping, sequence, or scalar).
+
+    Yields:
+        Each ``uses:`` value and its 1-based line number, in document order.
+    """
+    if isinstance(node, CommentedMap):
+        for key, value in node.items():
+            if key == "uses" and isinstance(value, str):
+                yield value, node.lc.value(key)[0] + 1
+            else:
+                yield from _iter_uses(value)
+    elif isinstance(node, CommentedSeq):
+        for item in node:
+            yield from _iter_uses(item)
+
+
+@functools.cache
+def _safety_command() -> str | None:
+    """Locate the safety CLI once per session.
+
+    Returns:
+        Path to the safety executable, or None if the package is not installed
+        or the command is not on PATH.
+    """
+    if importlib.util.find_spec("safety") is None:
+        return None
+    return shutil.which("safety")
+
+
 def _run_safety_scan(
     safety_cmd: str, requirements_file: Path, timeout: int = 60
-) -> subprocess.CompletedProcess[str] | None:
+) -> subprocess.CompletedProcess[bytes] | None:
     """Run safety CLI scan with fallback to legacy command.
 
     Args:
@@ -271,7 +368,6 @@ def _run_safety_scan(
         return subprocess.run(  # noqa: S603
             [safety_cmd, "scan", "--output", "json", "--target", str(requirements_file.parent)],
             capture_output=True,
-            text=True,
             timeout=timeout,
             check=False,
         )
@@ -280,7 +376,6 @@ def _run_safety_scan(
             return subprocess.run(  # noqa: S603
                 [safety_cmd, "check", "--file", str(requirements_file), "--json"],
                 capture_output=True,
-                text=True,
                 timeout=timeout,
                 check=False,
             )
@@ -288,49 +383,94 @@ def _run_safety_scan(
             return None
 
 
+@pytest.fixture(scope="session")
+def pyproject_data() -> dict[str, Any]:
+    """Parse pyproject.toml once for every test that inspects it."""
+    pyproject_file = Path("pyproject.toml")
+
+    if not pyproject_file.exists():
+        pytest.skip("pyproject.toml not found")
+
+    with pyproject_file.open("rb") as f:
+        return tomllib.load(f)
+
+
+@pytest.fixture(scope="session")
+def requirements_text() -> dict[str, str]:
+    """Read each requirements file once, keyed by file name.
+
+    Missing files are left out of the mapping.
+    """
+    return {
+        filename: Path(filename).read_text(encoding="utf-8")
+        for filename in _REQUIREMENTS_FILES
+        if Path(filename).exists()
+    }
+
+
+@pytest.fixture(scope="session")
+def workflow_contents() -> dict[Path, str]:
+    """Read every GitHub Actions workflow file once, keyed by path."""
+    workflows_dir = Path(".github/workflows")
+
+    if not workflows_dir.exists():
+        pytest.skip(".github/workflows directory not found")
+
+    # scandir reuses the file type from the directory listing, saving a stat per entry
+    with os.scandir(workflows_dir) as entries:
+        workflow_files = sorted(
+            Path(entry.path)
+            for entry in entries
+            if entry.name.endswith(_WORKFLOW_SUFFIXES) and entry.is_file()
+        )
+
+    # Reads release the GIL, so the files are fetched concurrently
+    with ThreadPoolExecutor(max_workers=_WORKFLOW_READ_WORKERS) as executor:
+        contents = executor.map(lambda path: path.read_text(encoding="utf-8"), workflow_files)
+        return dict(zip(workflow_files, contents, strict=True))
+
+
 class TestDependencyPinning:
     """Tests for dependency version pinning."""
 
-    def _check_requirements_file_pinning(self, file_path: Path) -> None:
+    def _check_requirements_file_pinning(
+        self, filename: str, requirements_text: dict[str, str]
+    ) -> None:
         """Helper to check that a requirements file pins all dependencies.
 
         Args:
-            file_path: Path to the requirements file to check.
+            filename: Name of the requirements file to check.
+            requirements_text: Session-cached contents of each requirements file.
         """
-        if not file_path.exists():
-            pytest.skip(f"{file_path.name} not found")
+        content = requirements_text.get(filename)
+        if content is None:
+            pytest.skip(f"{filename} not found")
 
-        with open(file_path, encoding="utf-8") as f:
-            lines = f.readlines()
+        # Check if version constraint is valid using utility
+        require_exact_pin = filename == "requirements.txt"
 
-        for line_num, line in enumerate(lines, 1):
-            # Check if version constraint is valid using utility
-            require_exact_pin = file_path.name == "requirements.txt"
-            result = validate_version_constraint(line, require_exact_pin)
+        for match in _REQ_LINE_RE.finditer(content):
+            result = validate_version_constraint(match.group().strip(), require_exact_pin)
 
             if not result.is_valid:
+                line_num = content.count("\n", 0, match.start()) + 1
                 pytest.fail(f"Line {line_num}: {result.message}")
 
-    @pytest.mark.parametrize("filename", ["requirements.txt", "requirements-dev.txt"])
-    def test_requirements_files_versions_pinned(self, filename: str) -> None:
+    @pytest.mark.parametrize("filename", _REQUIREMENTS_FILES)
+    def test_requirements_files_versions_pinned(
+        self, filename: str, requirements_text: dict[str, str]
+    ) -> None:
         """Test that requirements files pin all dependencies.
 
         Args:
             filename: Name of the requirements file to test.
+            requirements_text: Session-cached contents of each requirements file.
         """
-        requirements_file = Path(filename)
-        self._check_requirements_file_pinning(requirements_file)
+        self._check_requirements_file_pinning(filename, requirements_text)
 
-    def test_pyproject_toml_has_version_constraints(self) -> None:
+    def test_pyproject_toml_has_version_constraints(self, pyproject_data: dict[str, Any]) -> None:
         """Test that pyproject.toml has version constraints for dependencies."""
-        pyproject_file = Path("pyproject.toml")
-
-        if not pyproject_file.exists():
-            pytest.skip("pyproject.toml not found")
-
-        # Parse the TOML file
-        with open(pyproject_file, "rb") as f:
-            data = tomllib.load(f)
+        data = pyproject_data
 
         # Check for dependencies in various locations
         dependencies: list[str] = []
@@ -348,71 +488,42 @@ class TestDependencyPinning:
         # Ensure we found dependencies
         assert dependencies, "No dependencies found in pyproject.toml"
 
-        # Validate each dependency has a version constraint
-        for dep in dependencies:
-            dep_str = str(dep).strip()
-
-            # Skip empty dependencies
-            if not dep_str:
-                continue
-
-            # Check if dependency has a version constraint
-            # Must contain an operator (==, >=, <=, ~=, ^, etc.) or be a URL/git reference
-            has_version_constraint = (
-                any(op in dep_str for op in ["==", ">=", "<=", "~=", "!=", "^", "~"])
-                or dep_str.startswith(("git+", "hg+", "svn+", "bzr+", "http://", "https://"))
-                or "@" in dep_str  # For pip installable URLs
-            )
+        # Validate every dependency has a version constraint in one pass over the
+        # joined list: an operator (==, >=, <=, ~=, ^, etc.) or a URL/git reference
+        joined = "\n".join(dep_str for dep in dependencies if (dep_str := dep.strip()))
+        unconstrained = _UNCONSTRAINED_DEP_RE.findall(joined)
 
-            assert has_version_constraint, (
-                f"Dependency '{dep_str}' does not specify a version constraint. "
-                f"Use format like 'package>=1.0.0' or 'package==1.2.3'"
-            )
+        assert not unconstrained, (
+            f"Dependencies {unconstrained} do not specify a version constraint. "
+            f"Use format like 'package>=1.0.0' or 'package==1.2.3'"
+        )
 
 
 class TestGitHubActionsPinning:
     """Tests for GitHub Actions workflow pinning."""
 
-    def test_github_actions_use_pinned_versions(self) -> None:
+    def test_github_actions_use_pinned_versions(self, workflow_contents: dict[Path, str]) -> None:
         """Test that GitHub Actions workflows pin action versions."""
-        workflows_dir = Path(".github/workflows")
-
-        if not workflows_dir.exists():
-            pytest.skip(".github/workflows directory not found")
-
-        unpinned_actions: list[tuple[str, int]] = []
+        unpinned_actions: list[tuple[str, int, str]] = []
+        # The round-trip loader keeps line numbers for the failure message
+        yaml = YAML()
 
-        for workflow_file in workflows_dir.glob("*.yml"):
-            with open(workflow_file, encoding="utf-8") as f:
-                content = f.read()
-
-            # Check for uses: actions/...
-            # These should specify a version (tag, sha, or version)
+        for workflow_file, content in workflow_contents.items():
+            # Every uses: should specify a version (tag, sha, or version)
             # Pattern: uses: <action>@<version>
-
-            # Find all uses statements
-            for line_num, line in enumerate(content.split("\n"), 1):
-                # Check line is not a comment
-                if line.strip().startswith("#"):
-                    continue
-
-                # Match uses: with proper action format
-                match = re.search(r"^\s*-?\s*uses:\s+([^\s#]+)", line)
-                if match:
-                    uses_value = match.group(1).strip()
-
-                    # Skip local action paths and already pinned actions
-                    is_not_local = not uses_value.startswith(("./", "../"))
-                    is_not_pinned = "@" not in uses_value
-                    if is_not_local and is_not_pinned and "/" in uses_value:
-                        # Verify it looks like a GitHub action (owner/repo format)
-                        unpinned_actions.append((str(workflow_file), line_num))
+            for uses_value, line_num in _iter_uses(yaml.load(content)):
+                # Skip local and Docker actions, and already pinned actions
+                is_repo_action = not uses_value.startswith(_NON_REPO_ACTION_PREFIXES)
+                is_not_pinned = "@" not in uses_value
+                # Verify it looks like a GitHub action (owner/repo format)
+                if is_repo_action and is_not_pinned and "/" in uses_value:
+                    unpinned_actions.append((str(workflow_file), line_num, uses_value))
 
         # Assert that no unpinned actions were found
         if unpinned_actions:
             error_msg = "Found unpinned GitHub Actions:\n"
-            for file_path, line_num in unpinned_actions:
-                error_msg += f"  - {file_path}:{line_num}\n"
+            for file_path, line_num, uses_value in unpinned_actions:
+                error_msg += f"  - {file_path}:{line_num}: {uses_value}\n"
             error_msg += (
                 "Please pin all GitHub Actions to specific versions (tags or SHAs) for security."
             )
@@ -422,20 +533,26 @@ class TestGitHubActionsPinning:
 class TestDependencyVulnerabilities:
     """Tests for known dependency vulnerabilities."""
 
+    @pytest.mark.slow
+    @pytest.mark.network
     def test_no_known_vulnerable_versions(self) -> None:
-        """Test that dependencies are not using known vulnerable versions."""
-        if importlib.util.find_spec("safety") is None:
-            pytest.skip("safety package not installed")
+        """Test that dependencies are not using known vulnerable versions.
+
+        The safety scan is a network-bound subprocess that can take up to a minute:
+        - Set SUPPLY_CHAIN_SKIP_SAFETY=1 to skip it (e.g. in local dev loops)
+        - Or deselect it with -m "not slow", or skip it offline with --no-network
+        """
+        if os.getenv("SUPPLY_CHAIN_SKIP_SAFETY", "0") == "1":
+            pytest.skip("Safety scan skipped via SUPPLY_CHAIN_SKIP_SAFETY=1")
+
+        safety_cmd = _safety_command()
+        if not safety_cmd:
+            pytest.skip("safety package not installed or command not found in PATH")
 
         requirements_file = Path("requirements.txt")
         if not requirements_file.exists():
             pytest.skip("requirements.txt not found")
 
-        # Find safety command path
-        safety_cmd = shutil.which("safety")
-        if not safety_cmd:
-            pytest.skip("safety command not found in PATH")
-
         # Run safety scan with fallback
         result = _run_safety_scan(safety_cmd, requirements_file)
 
@@ -444,7 +561,7 @@ class TestDependencyVulnerabilities:
             pytest.skip("Safety check timed out")
 
         # Check if safety command failed due to EOF error
-        if result.returncode != 0 and result.stderr and "EOF" in result.stderr:
+        if result.returncode != 0 and result.stderr and b"EOF" in result.stderr:
             pytest.skip("Safety command failed with EOF error (likely interactive mode issue)")
 
         # Parse vulnerability report using helper function
@@ -457,7 +574,7 @@ class TestDependencyVulnerabilities:
             if result.returncode != 0:
                 error_msg = (
                     "Vulnerable dependencies found. Run 'safety scan' for details. "
-                    f"Output: {result.stdout[:500] if result.stdout else 'no output'}..."
+                    f"Output: {result.stdout[:500].decode('utf-8', 'replace') or 'no output'}..."
                 )
                 raise AssertionError(error_msg)
             # If returncode is 0 but parsing failed, skip (no vulnerabilities detected)
@@ -466,6 +583,20 @@ class TestDependencyVulnerabilities:
             # Validate no real vulnerabilities exist
             _validate_no_vulnerabilities(vulnerabilities, ignored_vulnerabilities)
 
+    def test_parse_safety_json_skips_log_noise(self) -> None:
+        """Test that bracketed log lines before the report are not taken as the report."""
+        stdout = (
+            b"Scanning 3 packages [1/1]\n"
+            b"Results: []\n"
+            b'{"vulnerabilities":[{"package_name":"demo","vulnerability_id":"1"}]}\n'
+        )
+
+        safety_data = _parse_safety_json(stdout)
+
+        assert safety_data == {
+            "vulnerabilities": [{"package_name": "demo", "vulnerability_id": "1"}]
+        }
+
 
 class TestLicenseCompliance:
     """Tests for license compliance."""
@@ -493,38 +624,24 @@ class TestLicenseCompliance:
 class TestPackageValidity:
     """Tests for package validity and integrity."""
 
-    def test_no_direct_url_installs(self) -> None:
+    def test_no_direct_url_installs(self, requirements_text: dict[str, str]) -> None:
         """Test that requirements don't use direct URL installs (security risk).
 
         This test can be configured to either fail strictly or warn only:
         - Set SUPPLY_CHAIN_WARN_ONLY=1 to log warnings instead of failing
         - Default behavior is to fail the test when dangerous URLs are found
         """
-        requirements_file = Path("requirements.txt")
-
-        if not requirements_file.exists():
+        content = requirements_text.get("requirements.txt")
+        if content is None:
             pytest.skip("requirements.txt not found")
 
-        with open(requirements_file, encoding="utf-8") as f:
-            lines = f.readlines()
-
-        dangerous_patterns = [
-            r"git\+",
-            r"http://",
-            r"https://(?!(?:files\.pythonhosted\.org|pypi\.org)(?:[:/]|$))",
-        ]
-
         dangerous_urls = []
 
-        for line_num, line in enumerate(lines, 1):
-            line = line.strip()
-            if not line or line.startswith("#"):
-                continue
-
-            for pattern in dangerous_patterns:
-                if re.search(pattern, line):
-                    dangerous_urls.append((line_num, line))
-                    break
+        for match in _REQ_LINE_RE.finditer(content):
+            line = match.group().strip()
+            if _DANGEROUS_URL_RE.search(line):
+                line_num = content.count("\n", 0, match.start()) + 1
+                dangerous_urls.append((line_num, line))
 
         if dangerous_urls:
             error_msg = "Found potentially dangerous direct URL installs:\n"
@@ -4,6 +4,8 @@ This module tests security aspects of the TOML handler including path validation
 atomic operations, permission handling, and error cleanup.
 """
 
+import contextlib
+import glob
 import os
 import stat
 import sys
@@ -16,6 +18,22 @@ import pytest
 
 from review_bot_automator.handlers.toml_handler import TomlHandler
 
+# Pre-encoded TOML written as the starting file content
+_ORIGINAL_TOML = b"original = 'value'"
+
+# Syntactically valid TOML with potentially harmful string content, paired with
+# a description. Security is enforced in context of usage, not in TOML parsing itself
+_HARMFUL_TOML_CASES = (
+    ("key = '`echo test`'", "backticks"),
+    ("key = '$(whoami)'", "subshell"),
+    ("key = '${GITHUB_TOKEN}'", "env-var"),
+    ("key = '../../../etc/passwd'", "path-traversal"),
+)
+
+# Large but valid TOML content (~1MB), built once at import
+_LARGE_VALUE = "x" * 1_000_000
+_LARGE_TOML = f"key = '{_LARGE_VALUE}'"
+
 
 @pytest.fixture(scope="module", autouse=True)
 def enable_toml_for_tests() -> Generator[None, None, None]:
@@ -25,13 +43,58 @@ def enable_toml_for_tests() -> Generator[None, None, None]:
     """
     import review_bot_automator.handlers.toml_handler as toml_handler_module
 
-    with (
-        patch.object(toml_handler_module, "TOML_READ_AVAILABLE", True, create=True),
-        patch.object(toml_handler_module, "TOML_WRITE_AVAILABLE", True, create=True),
-    ):
+    # The builtin monkeypatch fixture is function-scoped, so use a module-wide context
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(toml_handler_module, "TOML_READ_AVAILABLE", True, raising=False)
+        mp.setattr(toml_handler_module, "TOML_WRITE_AVAILABLE", True, raising=False)
         yield
 
 
+def _write_temp_toml(content: bytes, directory: str | None = None) -> str:
+    """Create a .toml temp file holding content and return its path.
+
+    mkstemp hands back a raw descriptor, so the content goes out in a single
+    write without a buffered text wrapper.
+    """
+    fd, path = tempfile.mkstemp(suffix=".toml", dir=directory)
+    try:
+        os.write(fd, content)
+    finally:
+        os.close(fd)
+    return path
+
+
+def _temp_file_prefix(original_path: str) -> str:
+    """Return the path prefix of temp files the handler creates next to original_path."""
+    directory, name = os.path.split(original_path)
+    return os.path.join(directory, f".{name}.tmp")
+
+
+@pytest.fixture(scope="module")
+def handler() -> TomlHandler:
+    """Provide one TomlHandler rooted at the current directory for the module."""
+    return TomlHandler()
+
+
+@pytest.fixture(scope="module")
+def workspace_handler(tmp_path_factory: pytest.TempPathFactory) -> TomlHandler:
+    """Provide one TomlHandler rooted at a module-wide temporary workspace."""
+    return TomlHandler(workspace_root=str(tmp_path_factory.mktemp("ws")))
+
+
+@pytest.fixture(scope="module")
+def scratch_toml(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Provide one scratch TOML file path shared by the module."""
+    return tmp_path_factory.mktemp("scratch") / "scratch.toml"
+
+
+@pytest.fixture
+def original_toml(scratch_toml: Path) -> Path:
+    """Reset the shared scratch file to the known-good TOML and return its path."""
+    scratch_toml.write_bytes(_ORIGINAL_TOML)
+    return scratch_toml
+
+
 class TestTomlHandlerPathSecurity:
     """Test TOML handler path security validation."""
 
@@ -56,10 +119,11 @@ class TestTomlHandlerPathSecurity:
             "absolute-var-log",
         ],
     )
-    def test_apply_change_rejects_path_traversal(self, tmp_path: Path, path: str) -> None:
+    def test_apply_change_rejects_path_traversal(
+        self, workspace_handler: TomlHandler, path: str
+    ) -> None:
         """Test that apply_change rejects path traversal attempts."""
-        handler = TomlHandler(workspace_root=str(tmp_path))
-        result = handler.apply_change(path, "key = 'value'", 1, 3)
+        result = workspace_handler.apply_change(path, "key = 'value'", 1, 3)
         assert result is False, f"Should reject traversal path: {path}"
 
     @pytest.mark.parametrize(
@@ -87,64 +151,73 @@ class TestTomlHandlerPathSecurity:
             "unc-network-path",
         ],
     )
-    def test_apply_change_rejects_absolute_paths(self, path: str) -> None:
+    def test_apply_change_rejects_absolute_paths(self, handler: TomlHandler, path: str) -> None:
         """Test that apply_change rejects absolute paths."""
-        handler = TomlHandler()
         result = handler.apply_change(path, "key = 'value'", 1, 3)
         assert result is False, f"Should reject absolute path: {path}"
 
-    def test_apply_change_accepts_relative_paths(self, toml_handler: TomlHandler) -> None:
+    @pytest.mark.parametrize("path", ["config.toml", "settings.toml", "pyproject.toml"])
+    def test_apply_change_accepts_relative_paths(
+        self, toml_handler: TomlHandler, path: str
+    ) -> None:
         """Test that apply_change accepts safe relative paths with actual files."""
         # Use shared fixture instead of manual instantiation
         handler = toml_handler
 
-        safe_paths = [
-            "config.toml",
-            "settings.toml",
-            "pyproject.toml",
-        ]
-
-        for path in safe_paths:
-            # Create the file inside the handler's configured workspace
-            test_file = Path(handler.workspace_root) / path
-            test_file.write_text("original = 'value'")
-
-            # Apply change to the existing file
-            result = handler.apply_change(path, "key = 'value'", 1, 1)
-            # Path validation should pass and the operation should complete
-            assert result is True, f"Should accept safe relative path: {path}"
+        # Create the file inside the handler's configured workspace
+        test_file = Path(handler.workspace_root) / path
+        test_file.write_bytes(_ORIGINAL_TOML)
 
-    def test_validate_change_accepts_various_path_traversal_forms(self) -> None:
-        """Test that validate_change validates TOML content only."""
-        handler = TomlHandler()
+        # Apply change to the existing file
+        result = handler.apply_change(path, "key = 'value'", 1, 1)
+        # Path validation should pass and the operation should complete
+        assert result is True, f"Should accept safe relative path: {path}"
 
-        traversal_paths = [
+    @pytest.mark.parametrize(
+        "path",
+        [
             "../../../etc/passwd",
             "../../sensitive",
             "../parent",
             "..\\..\\..\\windows\\system32",
-        ]
-
-        for path in traversal_paths:
-            valid, _ = handler.validate_change(path, "key = 'value'", 1, 3)
-            # validate_change only validates TOML content, not paths - all should pass
-            assert valid is True  # TOML content is valid
-
-    def test_validate_change_accepts_various_absolute_paths(self) -> None:
+        ],
+        ids=[
+            "traversal-etc-passwd",
+            "traversal-sensitive",
+            "traversal-parent",
+            "traversal-windows",
+        ],
+    )
+    def test_validate_change_accepts_various_path_traversal_forms(
+        self, handler: TomlHandler, path: str
+    ) -> None:
         """Test that validate_change validates TOML content only."""
-        handler = TomlHandler()
+        valid, _ = handler.validate_change(path, "key = 'value'", 1, 3)
+        # validate_change only validates TOML content, not paths - all should pass
+        assert valid is True  # TOML content is valid
 
-        absolute_paths = [
+    @pytest.mark.parametrize(
+        "path",
+        [
             "/etc/passwd",
             "/var/log/secure",
             "C:\\Windows\\System32",
             "D:\\Program Files",
-        ]
-
-        for path in absolute_paths:
-            valid, _ = handler.validate_change(path, "key = 'value'", 1, 3)
-            # validate_change only validates TOML content, not paths - all should pass
-            assert valid is True  # TOML content is valid
+        ],
+        ids=[
+            "absolute-etc-passwd",
+            "absolute-var-log",
+            "windows-system32",
+            "windows-program-files",
+        ],
+    )
+    def test_validate_change_accepts_various_absolute_paths(
+        self, handler: TomlHandler, path: str
+    ) -> None:
+        """Test that validate_change validates TOML content only."""
+        valid, _ = handler.validate_change(path, "key = 'value'", 1, 3)
+        # validate_change only validates TOML content, not paths - all should pass
+        assert valid is True  # TOML content is valid
 
 
 class TestTomlHandlerAtomicOperations:
@@ -152,12 +225,9 @@ class TestTomlHandlerAtomicOperations:
 
     def test_apply_change_atomic_write(self) -> None:
         """Test that apply_change uses atomic file replacement with line-based editing."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".toml", delete=False) as f:
-            # Write original TOML with multiple lines
-            f.write("# Configuration\noriginal = 'value'\nother = 'data'\n")
-            f.flush()
-            original_path = f.name
-            temp_dir = os.path.dirname(f.name)
+        # Write original TOML with multiple lines
+        original_path = _write_temp_toml(b"# Configuration\noriginal = 'value'\nother = 'data'\n")
+        temp_dir = os.path.dirname(original_path)
 
         # Create handler with temp directory as workspace root
         handler = TomlHandler(workspace_root=temp_dir)
@@ -175,8 +245,7 @@ class TestTomlHandlerAtomicOperations:
             assert "other = 'data'" in content  # Line 3 preserved
 
         finally:
-            if os.path.exists(original_path):
-                os.unlink(original_path)
+            Path(original_path).unlink(missing_ok=True)
 
     def test_apply_change_early_return_on_invalid_toml(self) -> None:
         """Test that apply_change returns early when file contains invalid TOML.
@@ -188,13 +257,8 @@ class TestTomlHandlerAtomicOperations:
         with tempfile.TemporaryDirectory() as tmpdir:
             handler = TomlHandler(workspace_root=tmpdir)
 
-            with tempfile.NamedTemporaryFile(
-                mode="w", suffix=".toml", dir=tmpdir, delete=False
-            ) as f:
-                # Write invalid TOML to trigger early return
-                f.write("invalid toml [")
-                f.flush()
-                original_path = f.name
+            # Write invalid TOML to trigger early return
+            original_path = _write_temp_toml(b"invalid toml [", tmpdir)
 
             try:
                 # This should fail early during TOML parsing, before temp file creation
@@ -202,28 +266,24 @@ class TestTomlHandlerAtomicOperations:
                 assert result is False
 
                 # Verify no temp files were created (early return before temp file creation)
-                temp_dir = os.path.dirname(original_path)
-                expected_prefix = f".{os.path.basename(original_path)}.tmp"
-                temp_files = [f for f in os.listdir(temp_dir) if f.startswith(expected_prefix)]
-                assert len(temp_files) == 0, "No temporary files should be created on early return"
+                leftover = next(
+                    glob.iglob(f"{glob.escape(_temp_file_prefix(original_path))}*"), None
+                )
+                assert leftover is None, "No temporary files should be created on early return"
 
             finally:
-                if os.path.exists(original_path):
-                    os.unlink(original_path)
+                Path(original_path).unlink(missing_ok=True)
 
     @pytest.mark.skipif(sys.platform.startswith("win"), reason="chmod semantics differ on Windows")
     def test_apply_change_preserves_file_permissions(self) -> None:
         """Test that apply_change preserves original file permissions."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".toml", delete=False) as f:
-            # Write original TOML
-            f.write("key = 'value'")
-            f.flush()
-            original_path = f.name
-            temp_dir = os.path.dirname(f.name)
+        # Write original TOML
+        original_path = _write_temp_toml(b"key = 'value'")
+        temp_dir = os.path.dirname(original_path)
 
-            # Set specific permissions
-            original_mode = 0o600  # Read/write for owner only
-            os.chmod(original_path, original_mode)
+        # Set specific permissions
+        original_mode = 0o600  # Read/write for owner only
+        os.chmod(original_path, original_mode)
 
         # Create handler with temp directory as workspace root
         handler = TomlHandler(workspace_root=temp_dir)
@@ -238,17 +298,13 @@ class TestTomlHandlerAtomicOperations:
             assert current_mode == original_mode, "File permissions should be preserved"
 
         finally:
-            if os.path.exists(original_path):
-                os.unlink(original_path)
+            Path(original_path).unlink(missing_ok=True)
 
     def test_apply_change_handles_permission_errors(self) -> None:
         """Test that apply_change handles permission errors gracefully."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".toml", delete=False) as f:
-            # Write original TOML
-            f.write("key = 'value'")
-            f.flush()
-            original_path = f.name
-            temp_dir = os.path.dirname(f.name)
+        # Write original TOML
+        original_path = _write_temp_toml(b"key = 'value'")
+        temp_dir = os.path.dirname(original_path)
 
         # Create handler with temp directory as workspace root
         handler = TomlHandler(workspace_root=temp_dir)
@@ -264,9 +320,9 @@ class TestTomlHandlerAtomicOperations:
 
         finally:
             # Restore permissions and clean up
-            if os.path.exists(original_path):
+            with contextlib.suppress(FileNotFoundError):
                 os.chmod(original_path, 0o644)
-                os.unlink(original_path)
+            Path(original_path).unlink(missing_ok=True)
 
 
 class TestTomlHandlerErrorHandling:
@@ -277,13 +333,8 @@ class TestTomlHandlerErrorHandling:
         # Anchor temp file inside a dedicated workspace so handler accepts the path
         with tempfile.TemporaryDirectory() as tmpdir:
             handler = TomlHandler(workspace_root=tmpdir)
-            with tempfile.NamedTemporaryFile(
-                mode="w", suffix=".toml", dir=tmpdir, delete=False
-            ) as f:
-                # Write original TOML
-                f.write("key = 'value'")
-                f.flush()
-                original_path = f.name
+            # Write original TOML
+            original_path = _write_temp_toml(b"key = 'value'", tmpdir)
             try:
                 # Mock os.replace to raise an error
                 with patch("os.replace", side_effect=OSError("Write error")):
@@ -291,29 +342,21 @@ class TestTomlHandlerErrorHandling:
                     assert result is False
 
                 # Verify no temp files were left behind after error
-                temp_dir = os.path.dirname(original_path)
-                expected_prefix = f".{os.path.basename(original_path)}.tmp"
-                temp_files = [fn for fn in os.listdir(temp_dir) if fn.startswith(expected_prefix)]
-                assert (
-                    len(temp_files) == 0
-                ), "Temporary files should be cleaned up after write error"
+                leftover = next(
+                    glob.iglob(f"{glob.escape(_temp_file_prefix(original_path))}*"), None
+                )
+                assert leftover is None, "Temporary files should be cleaned up after write error"
             finally:
-                if os.path.exists(original_path):
-                    os.unlink(original_path)
+                Path(original_path).unlink(missing_ok=True)
 
     def test_apply_change_handles_fsync_errors(self) -> None:
         """Test that apply_change handles fsync errors gracefully."""
         # Anchor temp file inside a dedicated workspace so handler accepts the path
         with tempfile.TemporaryDirectory() as tmpdir:
             handler = TomlHandler(workspace_root=tmpdir)
-            with tempfile.NamedTemporaryFile(
-                mode="w", suffix=".toml", dir=tmpdir, delete=False
-            ) as f:
-                # Write original TOML
-                original_content = "key = 'value'"
-                f.write(original_content)
-                f.flush()
-                original_path = f.name
+            # Write original TOML
+            original_content = "key = 'value'"
+            original_path = _write_temp_toml(original_content.encode(), tmpdir)
             try:
                 # Mock fsync to raise an error
                 with patch("os.fsync", side_effect=OSError("Fsync error")):
@@ -326,77 +369,56 @@ class TestTomlHandlerErrorHandling:
                             f.read() == original_content
                         ), "File content should remain unchanged after fsync error"
             finally:
-                if os.path.exists(original_path):
-                    os.unlink(original_path)
+                Path(original_path).unlink(missing_ok=True)
 
-    def test_validate_change_handles_missing_toml_libraries(self) -> None:
+    def test_validate_change_handles_missing_toml_libraries(
+        self, handler: TomlHandler, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Test that validate_change handles missing TOML libraries."""
-        handler = TomlHandler()
-
-        with patch("review_bot_automator.handlers.toml_handler.TOML_READ_AVAILABLE", False):
-            valid, msg = handler.validate_change("test.toml", "key = 'value'", 1, 3)
-            assert valid is False
-            assert "not available" in msg.lower()
-
-    def test_apply_change_handles_missing_toml_libraries(self) -> None:
+        monkeypatch.setattr("review_bot_automator.handlers.toml_handler.TOML_READ_AVAILABLE", False)
+        valid, msg = handler.validate_change("test.toml", "key = 'value'", 1, 3)
+        assert valid is False
+        assert "not available" in msg.lower()
+
+    def test_apply_change_handles_missing_toml_libraries(
+        self, handler: TomlHandler, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Test that apply_change handles missing TOML libraries."""
-        handler = TomlHandler()
-
-        with patch("review_bot_automator.handlers.toml_handler.TOML_READ_AVAILABLE", False):
-            result = handler.apply_change("test.toml", "key = 'value'", 1, 3)
-            assert result is False
+        monkeypatch.setattr("review_bot_automator.handlers.toml_handler.TOML_READ_AVAILABLE", False)
+        result = handler.apply_change("test.toml", "key = 'value'", 1, 3)
+        assert result is False
 
 
 class TestTomlHandlerContentSecurity:
     """Test TOML handler content security validation."""
 
-    def test_validate_change_accepts_potentially_harmful_content(self) -> None:
+    @pytest.mark.parametrize(
+        ("content", "description"),
+        _HARMFUL_TOML_CASES,
+        ids=[description for _, description in _HARMFUL_TOML_CASES],
+    )
+    def test_validate_change_accepts_potentially_harmful_content(
+        self, handler: TomlHandler, content: str, description: str
+    ) -> None:
         """Test that validate_change handles potentially harmful but valid TOML content."""
-        handler = TomlHandler()
-
-        # Use syntactically valid TOML with potentially harmful string content
-        # Security is enforced in context of usage, not in TOML parsing itself
-        test_cases = [
-            ("key = '`echo test`'", "backticks"),
-            ("key = '$(whoami)'", "subshell"),
-            ("key = '${GITHUB_TOKEN}'", "env-var"),
-            ("key = '../../../etc/passwd'", "path-traversal"),
-        ]
-
-        for content, description in test_cases:
-            valid, msg = handler.validate_change("test.toml", content, 1, 1)
-            # Valid TOML syntax should be accepted (security is in usage context)
-            assert valid is True, f"Handler should accept valid TOML with {description}"
-            assert "Valid TOML" in msg, f"Expected success message for {description}, got: {msg}"
-
-    def test_apply_change_handles_large_content(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        valid, msg = handler.validate_change("test.toml", content, 1, 1)
+        # Valid TOML syntax should be accepted (security is in usage context)
+        assert valid is True, f"Handler should accept valid TOML with {description}"
+        assert "Valid TOML" in msg, f"Expected success message for {description}, got: {msg}"
+
+    def test_apply_change_handles_large_content(
+        self, handler: TomlHandler, original_toml: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Test that apply_change handles large content safely."""
-        handler = TomlHandler()
-
-        # Create large but valid TOML content (~1MB)
-        large_content = "key = '" + "x" * 1_000_000 + "'"
-
         # Set environment variable to allow temp files outside workspace
         # Using monkeypatch ensures automatic cleanup and prevents test interference
         monkeypatch.setenv("ALLOW_TEMP_OUTSIDE_WORKSPACE", "true")
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".toml", delete=False) as f:
-            # Write original TOML
-            f.write("original = 'value'")
-            f.flush()
-            original_path = f.name
+        result = handler.apply_change(str(original_toml), _LARGE_TOML, 1, 1)
+        # Should succeed with large content
+        assert result is True, "Handler should successfully apply large content"
 
-        try:
-            result = handler.apply_change(original_path, large_content, 1, 1)
-            # Should succeed with large content
-            assert result is True, "Handler should successfully apply large content"
-
-            # Verify file was updated
-            with open(original_path) as f:
-                updated_content = f.read()
-            assert "x" * 1_000_000 in updated_content, "File should contain the large content"
-            assert "key" in updated_content, "File should have the key from large_content"
-
-        finally:
-            if os.path.exists(original_path):
-                os.unlink(original_path)
+        # Verify file was updated
+        updated_content = original_toml.read_text()
+        assert _LARGE_VALUE in updated_content, "File should contain the large content"
+        assert "key" in updated_content, "File should have the key from _LARGE_TOML"